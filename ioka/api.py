@@ -1,15 +1,55 @@
 import logging
+import os
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, List, Literal, Optional, Tuple, Union
 from uuid import uuid4
 
-import requests
-from pydantic import BaseModel, Field, HttpUrl, SecretStr
+import orjson
+from pydantic import BaseModel, Field, HttpUrl, PrivateAttr, SecretStr
+from pydantic.errors import EnumMemberError
+from pydantic.utils import lenient_issubclass
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
 
 logger = logging.getLogger("ioka")
 
 
+def _iso_fast(v: str) -> Optional[str]:
+    """Нормализация строки канонического вида YYYY-MM-DDTHH:MM:SS[.ffffff][Z]
+    без разбора в datetime. Возвращает None, если строка другого вида.
+    """
+    if not v.isascii() or len(v) not in (19, 20, 26, 27) or v[4] != "-" or v[7] != "-" or v[10] != "T" or v[13] != ":" or v[16] != ":":
+        return None
+
+    year, month, day = v[0:4], v[5:7], v[8:10]
+    hour, minute, second = v[11:13], v[14:16], v[17:19]
+    if not (year + month + day + hour + minute + second).isdigit():
+        return None
+
+    # Дни после 28-го зависят от месяца и года, их проверяет fromisoformat
+    if year == "0000" or not ("01" <= month <= "12" and "01" <= day <= "28" and hour <= "23" and minute <= "59" and second <= "59"):
+        return None
+
+    tail = v[19:]
+    if tail == "" or tail == "Z":
+        return v[:19]
+
+    fraction = tail[1:7]
+    if tail[0] == "." and fraction.isdigit() and tail[7:] in ("", "Z"):
+        return v[:19] if fraction == "000000" else v[:26]
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _iso_norm(v: str) -> str:
+    return _iso_fast(v) or datetime.fromisoformat(v.replace("Z", "")).replace(tzinfo=None).isoformat()
+
+
 class ISODatetime(str):
     """Datetime value in the UTC+0 time zone in the format described in RFC 3339.
     For example: "2019-08-24T14:15:22"
@@ -20,31 +60,122 @@ class ISODatetime(str):
         yield cls.validate
 
     @classmethod
-    def validate(cls, v):
+    def validate(cls, v: Union[str, datetime]) -> str:
         if isinstance(v, str):
-            dt = datetime.fromisoformat(v.replace("Z", ""))
+            return _iso_norm(v)
         elif isinstance(v, datetime):
-            dt = v
-        else:
-            raise TypeError("Datetime string RFC 3339 or datetime required")
+            return v.replace(tzinfo=None).isoformat()
+
+        raise TypeError("Datetime string RFC 3339 or datetime required")
+
+
+class ApiResponse(BaseModel):
+    """Модель ответа API.
+    Ответы сервера считаются доверенными, поэтому по умолчанию модель создается
+    через `construct` без валидации. Поля ISODatetime при этом все равно
+    нормализуются. Полная валидация включается через `validate_response = True`.
+    """
+
+    validate_response: ClassVar[bool] = False
+
+    class Config:
+        # pydantic v2: model_config = ConfigDict(frozen=True, revalidate_instances="never")
+        allow_mutation = False
+        copy_on_model_validation = "none"
+
+    @classmethod
+    def from_api(cls, data: dict) -> object:
+        if cls.validate_response:
+            return cls(**data)
+
+        return cls._construct(data)
+
+    @classmethod
+    def from_iterable(cls, items: List[dict]) -> List[object]:
+        if cls.validate_response:
+            return [cls(**d) for d in items]
+
+        construct = cls._construct
+        return [construct(d) for d in items]
+
+    @classmethod
+    def _construct(cls, data: dict) -> object:
+        # construct сохраняет и необъявленные ключи, поэтому лишние поля ответа отбрасываются
+        fields = cls.__fields__
+        values = {k: v for k, v in data.items() if k in fields}
+
+        datetime_fields, nested_fields = cls._api_fields()
+        for name in datetime_fields:
+            value = values.get(name)
+            if value is not None:
+                values[name] = ISODatetime.validate(value)
 
-        return dt.replace(tzinfo=None).isoformat()
+        for name, model in nested_fields:
+            value = values.get(name)
+            if isinstance(value, dict):
+                values[name] = model.from_api(value)
+
+        return cls.construct(**values)
+
+    @classmethod
+    def _api_fields(cls) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, type], ...]]:
+        """Поля ISODatetime и вложенные модели ответа, вычисляются один раз для класса."""
+        api_fields = cls.__dict__.get("_api_fields_cache")
+        if api_fields is None:
+            datetime_fields = tuple(name for name, field in cls.__fields__.items() if field.type_ is ISODatetime)
+            nested_fields = tuple(
+                (name, field.type_) for name, field in cls.__fields__.items() if lenient_issubclass(field.type_, ApiResponse)
+            )
+            api_fields = cls._api_fields_cache = (datetime_fields, nested_fields)
+
+        return api_fields
+
+
+class FastEnum(Enum):
+    """Enum, значение которого при валидации pydantic ищется напрямую
+    в `_value2member_map_`.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls._validate
+
+    @classmethod
+    def _validate(cls, v, config):
+        try:
+            member = cls._value2member_map_[v]
+        except (KeyError, TypeError):
+            raise EnumMemberError(enum_values=list(cls))
+
+        return member.value if config.use_enum_values else member
 
 
 CAPTURE_METHOD_AUTO = "AUTO"
 CAPTURE_METHOD_MANUAL = "MANUAL"
 
 
-class CaptureMethodEnum(str, Enum):
+class CaptureMethodEnum(str, FastEnum):
     auto = CAPTURE_METHOD_AUTO
     manual = CAPTURE_METHOD_MANUAL
 
 
-class OrderStatusEnum(str, Enum):
-    expired = "EXPIRED"
-    unpaid = "UNPAID"
-    on_hold = "ON_HOLD"
-    paid = "PAID"
+CaptureMethod = Literal["AUTO", "MANUAL"]
+
+
+ORDER_STATUS_EXPIRED = "EXPIRED"
+ORDER_STATUS_UNPAID = "UNPAID"
+ORDER_STATUS_ON_HOLD = "ON_HOLD"
+ORDER_STATUS_PAID = "PAID"
+
+
+class OrderStatusEnum(str, FastEnum):
+    expired = ORDER_STATUS_EXPIRED
+    unpaid = ORDER_STATUS_UNPAID
+    on_hold = ORDER_STATUS_ON_HOLD
+    paid = ORDER_STATUS_PAID
+
+
+OrderStatus = Literal["EXPIRED", "UNPAID", "ON_HOLD", "PAID"]
 
 
 CURRENCY_KZT = "KZT"
@@ -52,17 +183,20 @@ CURRENCY_USD = "USD"
 CURRENCY_RUB = "RUB"
 
 
-class CurrencyEnum(str, Enum):
+class CurrencyEnum(str, FastEnum):
     kzt = CURRENCY_KZT
     usd = CURRENCY_USD
     rub = CURRENCY_RUB
 
 
+Currency = Literal["KZT", "USD", "RUB"]
+
+
 class CreateOrder(BaseModel):
     amount: int = Field(..., ge=100)
     currency: Optional[CurrencyEnum]
     capture_method: Optional[CaptureMethodEnum]
-    external_id: str = Field(str(uuid4()), min_length=1)
+    external_id: str = Field(default_factory=lambda: str(uuid4()), min_length=1)
     description: Optional[str]
     mcc: Optional[str] = Field(None, min_length=4, max_length=4)
     extra_info: Optional[dict]
@@ -92,7 +226,7 @@ PAYMENT_STATUS_CANCELLED = "CANCELLED"
 PAYMENT_STATUS_DECLINED = "DECLINED"
 
 
-class PaymentStatusEnum(str, Enum):
+class PaymentStatusEnum(str, FastEnum):
     pending = PAYMENT_STATUS_PENDING
     requires_action = PAYMENT_STATUS_REQUIRES_ACTION
     approved = PAYMENT_STATUS_APPROVED
@@ -101,6 +235,16 @@ class PaymentStatusEnum(str, Enum):
     declined = PAYMENT_STATUS_DECLINED
 
 
+PaymentStatus = Literal[
+    "PENDING",
+    "REQUIRES_ACTION",
+    "APPROVED",
+    "CAPTURED",
+    "CANCELLED",
+    "DECLINED",
+]
+
+
 PAYER_TYPE_CARD = "CARD"
 PAYER_TYPE_CARD_NO_CVC = "CARD_NO_CVC"
 PAYER_TYPE_CARD_WITH_BINDING = "CARD_WITH_BINDING"
@@ -110,7 +254,7 @@ PAYER_TYPE_GOOGLE_PAY = "GOOGLE_PAY"
 PAYER_TYPE_MASTERPASS = "MASTERPASS"
 
 
-class PayerTypeEnum(str, Enum):
+class PayerTypeEnum(str, FastEnum):
     card = PAYER_TYPE_CARD
     card_no_cvc = PAYER_TYPE_CARD_NO_CVC
     card_with_binding = PAYER_TYPE_CARD_WITH_BINDING
@@ -120,8 +264,19 @@ class PayerTypeEnum(str, Enum):
     masterpass = PAYER_TYPE_MASTERPASS
 
 
-class Payer(BaseModel):
-    type: PayerTypeEnum
+PayerType = Literal[
+    "CARD",
+    "CARD_NO_CVC",
+    "CARD_WITH_BINDING",
+    "BINDING",
+    "APPLE_PAY",
+    "GOOGLE_PAY",
+    "MASTERPASS",
+]
+
+
+class Payer(ApiResponse):
+    type: PayerType
     pan_masked: Optional[str]
     expiry_date: Optional[str]
     holder: Optional[str]
@@ -133,24 +288,24 @@ class Payer(BaseModel):
     card_id: Optional[str]
 
 
-class Error(BaseModel):
+class Error(ApiResponse):
     code: str
     message: str
 
 
-class Acquirer(BaseModel):
+class Acquirer(ApiResponse):
     name: str
     reference: Optional[str]
 
 
-class Action(BaseModel):
+class Action(ApiResponse):
     url: str
 
 
-class CancelOrderResponse(BaseModel):
+class CancelOrderResponse(ApiResponse):
     id: str
     order_id: str
-    status: PaymentStatusEnum
+    status: PaymentStatus
     created_at: ISODatetime
     approved_amount: int
     captured_amount: int
@@ -204,7 +359,7 @@ EVENT_NAME_INSTALLMENT_REJECTED = "INSTALLMENT_REJECTED"
 EVENT_NAME_INSTALLMENT_DECLINED = "INSTALLMENT_DECLINED"
 
 
-class EventNameEnum(str, Enum):
+class EventNameEnum(str, FastEnum):
     order_created = EVENT_NAME_ORDER_CREATED
     payment_created = EVENT_NAME_PAYMENT_CREATED
     refund_created = EVENT_NAME_REFUND_CREATED
@@ -238,24 +393,56 @@ class EventNameEnum(str, Enum):
     installment_declined = EVENT_NAME_INSTALLMENT_DECLINED
 
 
-class Event(BaseModel):
+EventName = Literal[
+    "ORDER_CREATED",
+    "PAYMENT_CREATED",
+    "REFUND_CREATED",
+    "INSTALLMENT_CREATED",
+    "SPLIT_CREATED",
+    "ORDER_ON_HOLD",
+    "ORDER_PAID",
+    "ORDER_EXPIRED",
+    "PAYMENT_DECLINED",
+    "PAYMENT_ACTION_REQUIRED",
+    "PAYMENT_APPROVED",
+    "PAYMENT_CAPTURED",
+    "CAPTURE_DECLINED",
+    "PAYMENT_CANCELLED",
+    "CANCEL_DECLINED",
+    "REFUND_APPROVED",
+    "REFUND_DECLINED",
+    "SPLIT_APPROVED",
+    "SPLIT_DECLINED",
+    "SPLIT_REFUND_APPROVED",
+    "SPLIT_REFUND_DECLINED",
+    "CHECK_APPROVED",
+    "CHECK_DECLINED",
+    "OTP_SENT",
+    "SEND_OTP_DECLINED",
+    "OTP_CONFIRMED",
+    "CONFIRM_OTP_DECLINED",
+    "INSTALLMENT_ACTION_REQUIRED",
+    "INSTALLMENT_ISSUED",
+    "INSTALLMENT_REJECTED",
+    "INSTALLMENT_DECLINED",
+]
+
+
+class Event(ApiResponse):
     id: str
-    name: EventNameEnum
+    name: EventName
     created_at: ISODatetime
     order_id: str
     payment_id: Optional[str]
     refund_id: Optional[str]
     md: Optional[str]
     pa_req: Optional[str]
-    acs_url: Optional[HttpUrl]
-    term_url: Optional[HttpUrl]
-    action_url: Optional[HttpUrl]
+    acs_url: Optional[str]
+    term_url: Optional[str]
+    action_url: Optional[str]
     code: Optional[str]
     message: Optional[str]
 
-    class Config:
-        use_enum_values = True
-
 
 class RefundRule(BaseModel):
     account_id: str
@@ -266,7 +453,7 @@ OPERATION_TYPE_WITHOUT_VAT = 0
 OPERATION_TYPE_WITH_VAT = 100
 
 
-class OperationTypeEnum(int, Enum):
+class OperationTypeEnum(int, FastEnum):
     without_vat = OPERATION_TYPE_WITHOUT_VAT
     with_vat = OPERATION_TYPE_WITH_VAT
 
@@ -297,56 +484,57 @@ REFUND_STATUS_APPROVED = "APPROVED"
 REFUND_STATUS_DECLINED = "DECLINED"
 
 
-class RefundStatusEnum(str, Enum):
+class RefundStatusEnum(str, FastEnum):
     pending = REFUND_STATUS_PENDING
     approved = REFUND_STATUS_APPROVED
     declined = REFUND_STATUS_DECLINED
 
 
-class Refund(BaseModel):
+RefundStatus = Literal["PENDING", "APPROVED", "DECLINED"]
+
+
+class Refund(ApiResponse):
     id: str
     payment_id: str
     order_id: str
-    status: RefundStatusEnum
+    status: RefundStatus
     created_at: ISODatetime
     error: Optional[Error]
     acquirer: Optional[Acquirer]
 
-    class Config:
-        use_enum_values = True
 
+class BaseOrder(ApiResponse):
+    """Общие поля заказа для синхронного и асинхронного клиентов"""
 
-class Order(BaseModel):
     id: str
     shop_id: str
-    status: OrderStatusEnum
+    status: OrderStatus
     created_at: ISODatetime
     amount: int
-    currency: CurrencyEnum
-    capture_method: CaptureMethodEnum
+    currency: Currency
+    capture_method: CaptureMethod
     external_id: Optional[str] = Field(None, min_length=1)
     description: Optional[str]
-    extra_info: Optional[Dict]
+    extra_info: Optional[Any] = None
     attempts: Optional[int] = Field(10, ge=0, le=50)
     due_date: Optional[str]
     customer_id: Optional[str] = Field(None, min_length=1)
     card_id: Optional[str] = Field(None, min_length=1)
     mcc: Optional[str] = Field(None, min_length=4, max_length=4)
-    back_url: Optional[HttpUrl]
-    success_url: Optional[HttpUrl]
-    failure_url: Optional[HttpUrl]
+    back_url: Optional[str]
+    success_url: Optional[str]
+    failure_url: Optional[str]
     template: Optional[str]
-    checkout_url: Optional[HttpUrl]
+    checkout_url: Optional[str]
     access_token: Optional[str]
 
-    class Config:
-        use_enum_values = True
-
     @classmethod
     def set_api(cls, api: object) -> object:
         cls.api = api
         return cls
 
+
+class Order(BaseOrder):
     @classmethod
     def create(cls, **data) -> object:
         """Создание нового заказа.
@@ -391,7 +579,7 @@ class Order(BaseModel):
 
     @classmethod
     def list(cls) -> List[object]:
-        return [cls(**d) for d in cls.api.get_orders()]
+        return cls.from_iterable(cls.api.get_orders())
 
     @classmethod
     def retrieve(cls, order_id: str) -> object:
@@ -401,16 +589,53 @@ class Order(BaseModel):
         return CaptureOrderResponse(**self.api.capture_order(order_id=self.id, **data))
 
     def get_events(self) -> List[object]:
-        return [Event(**e) for e in self.api.get_order_events(order_id=self.id)]
+        return Event.from_iterable(self.api.get_order_events(order_id=self.id))
 
     def refund(self, **data) -> object:
         return Refund(**self.api.refund_order(order_id=self.id, **data))
 
     def refund_list(self):
-        return [Refund(**r) for r in self.api.get_refunds(order_id=self.id)]
+        return Refund.from_iterable(self.api.get_refunds(order_id=self.id))
 
     def refund_retrieve(self, refund_id: str):
-        return Refund(**self.api.get_refund_by_id(self.id, refund_id))
+        return Refund.from_api(self.api.get_refund_by_id(self.id, refund_id))
+
+
+class AsyncOrder(BaseOrder):
+    """Заказ для асинхронного клиента. Методы те же, что и у Order, но это
+    корутины. Привязка к API хранится отдельно от Order.
+    """
+
+    @classmethod
+    async def create(cls, **data) -> object:
+        return cls(**(await cls.api.create_order(**data)).get("order"))
+
+    @classmethod
+    async def cancel(cls, **data) -> object:
+        return CancelOrderResponse(**await cls.api.cancel_order(**data))
+
+    @classmethod
+    async def list(cls) -> List[object]:
+        return cls.from_iterable(await cls.api.get_orders())
+
+    @classmethod
+    async def retrieve(cls, order_id: str) -> object:
+        return cls(**await cls.api.get_order_by_id(order_id))
+
+    async def capture(self, **data) -> object:
+        return CaptureOrderResponse(**await self.api.capture_order(order_id=self.id, **data))
+
+    async def get_events(self) -> List[object]:
+        return Event.from_iterable(await self.api.get_order_events(order_id=self.id))
+
+    async def refund(self, **data) -> object:
+        return Refund(**await self.api.refund_order(order_id=self.id, **data))
+
+    async def refund_list(self):
+        return Refund.from_iterable(await self.api.get_refunds(order_id=self.id))
+
+    async def refund_retrieve(self, refund_id: str):
+        return Refund.from_api(await self.api.get_refund_by_id(self.id, refund_id))
 
 
 class Payment(BaseModel):
@@ -425,19 +650,127 @@ class Webhook(BaseModel):
     pass
 
 
-class Api(BaseModel):
+_URL_ORDER = "orders/{}".format
+_URL_CANCEL = "orders/{}/cancel".format
+_URL_CAPTURE = "orders/{}/capture".format
+_URL_EVENTS = "orders/{}/events".format
+_URL_REFUNDS = "orders/{}/refunds".format
+_URL_REFUND_BY_ID = "orders/{}/refunds/{}".format
+
+
+def _dumps(params: dict) -> bytes:
+    # extra_info может содержать нестроковые ключи, как и раньше с json.dumps
+    return orjson.dumps(params, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _log_request(method: str, url: str, params: Optional[dict], params_type: str, raise_for_status: bool) -> None:
+    logger.debug(
+        "Ioka api request with: method=%s, url=%s, params=%s, params_type=%s, raise_for_status=%s",
+        method,
+        url,
+        params,
+        params_type,
+        raise_for_status,
+    )
+
+
+def _request_kwargs(params: Optional[dict], params_type: str, headers: Optional[dict], body: str) -> dict:
+    # body: имя аргумента для тела запроса, "data" у requests и "content" у httpx
+    kwargs: dict
+    if not params:
+        kwargs = {}
+    elif params_type == "json":
+        kwargs = {body: _dumps(params)}
+    else:
+        kwargs = {params_type: params}
+
+    if headers:
+        kwargs["headers"] = headers
+
+    return kwargs
+
+
+def _log_response(response: "requests.Response | httpx.Response") -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Ioka api response: status=%s, text=%s", response.status_code, response.text)
+
+
+def _load_response(response: "requests.Response | httpx.Response") -> dict:
+    _log_response(response)
+    if not 200 <= response.status_code < 300:
+        response.raise_for_status()
+
+    return orjson.loads(response.content)
+
+
+_models_warmed = False
+
+
+def _warm_models() -> None:
+    """Прогрев моделей запросов: первая валидация в процессе выполняет ленивую
+    инициализацию pydantic, которая иначе приходится на первый запрос к API.
+    Выполняется один раз за процесс.
+    """
+    global _models_warmed
+    if _models_warmed:
+        return
+
+    CreateOrder(amount=100, back_url="https://ioka.kz")
+    CancelOrder(order_id="order_id", reason="reason")
+    CaptureOrder(amount=100)
+    RefundOrder(amount=100, rules=[{"account_id": "account_id", "amount": 100}], positions=[{"name": "name", "amount": 100, "count": 1}])
+    _models_warmed = True
+
+
+class BaseApi(BaseModel):
+    """Общие настройки синхронного и асинхронного клиентов"""
+
     api_host: HttpUrl = "https://stage-api.ioka.kz"
     api_key: SecretStr
     version: str = "v2"
-    headers: dict = {}
+
+    _base_url: str = PrivateAttr()
+    _headers: dict = PrivateAttr()
+
+    class Config:
+        # ключ и хост попадают в заголовки и клиент при создании, поэтому менять их нельзя
+        allow_mutation = False
 
     def __init__(self, **data) -> None:
         super().__init__(**data)
-        self.headers = {"API-KEY": self.api_key, "Content-Type": "application/json"}
+        self._headers = {"API-KEY": self.api_key.get_secret_value(), "Content-Type": "application/json"}
+        self._base_url = f"{self.api_host}/{self.version}/"
+        self._init_client()
+
+        if os.environ.get("IOKA_WARM_MODELS"):
+            _warm_models()
+
+    def _init_client(self) -> None:
+        raise NotImplementedError
+
+
+class Api(BaseApi):
+    _session: "requests.Session" = PrivateAttr()
+
+    def _init_client(self) -> None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers)
 
     def _request(
-        self, method: str, url: str, params: dict = None, params_type: str = "json", headers: dict = None, raise_for_status: bool = True
-    ) -> requests.Response | dict:
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        params_type: str = "json",
+        headers: Optional[dict] = None,
+        raise_for_status: bool = True,
+    ) -> "requests.Response | dict":
         """Отправка запроса
 
         Args:
@@ -445,150 +778,234 @@ class Api(BaseModel):
             url (str): Урл
             params (dict): Параметры запроса
             params_type (str, optional): Тип параметров. Defaults to "json".
-            headers (dict, optional): Заголовки. Defaults to self.headers.
+            headers (dict, optional): Дополнительные заголовки поверх заголовков сессии. Defaults to None.
             raise_for_status (bool, optional): Вызвать исключение при отрицательном статусе. Defaults to True.
 
         Returns:
             requests.Response | dict: Response
         """
 
-        headers = headers or self.headers
-        url = f"{self.api_host}/{self.version}/" + url
-
-        logger.debug(
-            f"Ioka api request with: method={method}, url={url}, params={params}, "
-            f"params_type={params_type}, headers={headers}, raise_for_status={raise_for_status}"
-        )
-
-        headers["API-KEY"] = self.api_key.get_secret_value()
+        url = self._base_url + url
 
-        if params:
-            response = requests.request(method, url, headers=headers, **{params_type: params})
-        else:
-            response = requests.request(method, url, headers=headers)
+        _log_request(method, url, params, params_type, raise_for_status)
+        kwargs = _request_kwargs(params, params_type, headers, body="data")
 
-        logger.debug(f"Ioka api response: response={response}, text={response.text}")
+        response = self._session.request(method, url, **kwargs)
 
         if raise_for_status:
-            response.raise_for_status()
-            return response.json()
+            return _load_response(response)
 
+        _log_response(response)
         return response
 
+    def _get(self, url: str) -> dict:
+        url = self._base_url + url
+        logger.debug("Ioka api request with: method=get, url=%s", url)
+        return _load_response(self._session.get(url))
+
+    def _post_json(self, url: str, params: dict) -> dict:
+        url = self._base_url + url
+        logger.debug("Ioka api request with: method=post, url=%s, params=%s", url, params)
+        return _load_response(self._session.post(url, data=_dumps(params)))
+
     # ORDER
     def create_order(self, **data) -> dict:
         """Создание нового заказа.
         https://ioka.kz/docs_v2.html#tag/orders/operation/CreateOrder
         """
 
-        request_params = {
-            "method": "post",
-            "url": "orders",
-            "params": CreateOrder(**data).dict(exclude_unset=True),
-        }
-
-        return self._request(**request_params)
+        return self._post_json("orders", CreateOrder(**data).dict(exclude_unset=True))
 
     def cancel_order(self, order_id, **data) -> dict:
         """Отмена авторизованного платежа заказа.
         https://ioka.kz/docs_v2.html#tag/orders/operation/CancelOrder
         """
 
-        request_params = {
-            "method": "post",
-            "url": f"orders/{order_id}/cancel",
-            "params": CancelOrder(**data).dict(exclude_unset=True),
-        }
-
-        return self._request(**request_params)
+        return self._post_json(_URL_CANCEL(order_id), CancelOrder(**data).dict(exclude_unset=True))
 
     def get_orders(self) -> dict:
         """Поиск заказов по фильтрам.
         https://ioka.kz/docs_v2.html#tag/orders/operation/GetOrders
         """
 
-        request_params = {
-            "method": "get",
-            "url": "orders",
-        }
-
-        return self._request(**request_params)
+        return self._get("orders")
 
     def get_order_by_id(self, order_id: str) -> dict:
         """Получение заказа по ID.
         https://ioka.kz/docs_v2.html#tag/orders/operation/GetOrderByID
         """
 
-        request_params = {
-            "method": "get",
-            "url": f"orders/{order_id}",
-        }
-
-        return self._request(**request_params)
+        return self._get(_URL_ORDER(order_id))
 
     def capture_order(self, order_id: str, **data) -> dict:
         """Полное или частичное списание авторизованного платежа заказа.
         https://ioka.kz/docs_v2.html#tag/orders/operation/CaptureOrder
         """
 
-        request_params = {
-            "method": "post",
-            "url": f"orders/{order_id}/capture",
-            "params": CaptureOrder(**data).dict(exclude_unset=True),
-        }
-
-        return self._request(**request_params)
+        return self._post_json(_URL_CAPTURE(order_id), CaptureOrder(**data).dict(exclude_unset=True))
 
     def get_order_events(self, order_id: str) -> dict:
         """Получение истории событий по заказу.
         https://ioka.kz/docs_v2.html#tag/orders/operation/GetOrderEvents
         """
 
-        request_params = {
-            "method": "get",
-            "url": f"orders/{order_id}/events",
-        }
-
-        return self._request(**request_params)
+        return self._get(_URL_EVENTS(order_id))
 
     def refund_order(self, order_id: str, **data) -> dict:
         """Создание нового возврата по списанному платежу.
         https://ioka.kz/docs_v2.html#tag/orders/operation/RefundOrder
         """
-        request_params = {
-            "method": "post",
-            "url": f"orders/{order_id}/refunds",
-            "params": RefundOrder(**data).dict(exclude_unset=True),
-        }
 
-        return self._request(**request_params)
+        return self._post_json(_URL_REFUNDS(order_id), RefundOrder(**data).dict(exclude_unset=True))
 
     def get_refunds(self, order_id: str) -> dict:
         """Выдача возвратов.
         https://ioka.kz/docs_v2.html#tag/orders/operation/GetRefundByID
         """
 
-        request_params = {
-            "method": "get",
-            "url": f"orders/{order_id}/refunds",
-        }
-
-        return self._request(**request_params)
+        return self._get(_URL_REFUNDS(order_id))
 
     def get_refund_by_id(self, order_id: str, refund_id: str) -> dict:
         """Выдача возвратов по идентификатору.
         https://ioka.kz/docs_v2.html#tag/orders/operation/GetRefundByID
         """
 
-        request_params = {
-            "method": "get",
-            "url": f"orders/{order_id}/refunds/{refund_id}",
-        }
-
-        return self._request(**request_params)
+        return self._get(_URL_REFUND_BY_ID(order_id, refund_id))
 
 
 class Ioka(Api):
     @property
     def order(self):
         return Order.set_api(self)
+
+
+class AsyncApi(BaseApi):
+    """Асинхронный клиент API на базе httpx.AsyncClient.
+    Методы запросов те же, что и у Api, но являются корутинами.
+    """
+
+    _client: "httpx.AsyncClient" = PrivateAttr()
+
+    def _init_client(self) -> None:
+        import httpx
+
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._headers,
+            http2=True,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        params_type: str = "json",
+        headers: Optional[dict] = None,
+        raise_for_status: bool = True,
+    ) -> "httpx.Response | dict":
+        """Отправка асинхронного запроса
+
+        Args:
+            method (str): Метод запроса
+            url (str): Урл
+            params (dict): Параметры запроса
+            params_type (str, optional): Тип параметров. Defaults to "json".
+            headers (dict, optional): Дополнительные заголовки поверх заголовков клиента. Defaults to None.
+            raise_for_status (bool, optional): Вызвать исключение при отрицательном статусе. Defaults to True.
+
+        Returns:
+            httpx.Response | dict: Response
+        """
+
+        _log_request(method, url, params, params_type, raise_for_status)
+        kwargs = _request_kwargs(params, params_type, headers, body="content")
+
+        response = await self._client.request(method, url, **kwargs)
+
+        if raise_for_status:
+            return _load_response(response)
+
+        _log_response(response)
+        return response
+
+    async def _get(self, url: str) -> dict:
+        logger.debug("Ioka api request with: method=get, url=%s", url)
+        return _load_response(await self._client.get(url))
+
+    async def _post_json(self, url: str, params: dict) -> dict:
+        logger.debug("Ioka api request with: method=post, url=%s, params=%s", url, params)
+        return _load_response(await self._client.post(url, content=_dumps(params)))
+
+    # ORDER
+    async def create_order(self, **data) -> dict:
+        """Создание нового заказа.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/CreateOrder
+        """
+
+        return await self._post_json("orders", CreateOrder(**data).dict(exclude_unset=True))
+
+    async def cancel_order(self, order_id, **data) -> dict:
+        """Отмена авторизованного платежа заказа.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/CancelOrder
+        """
+
+        return await self._post_json(_URL_CANCEL(order_id), CancelOrder(**data).dict(exclude_unset=True))
+
+    async def get_orders(self) -> dict:
+        """Поиск заказов по фильтрам.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/GetOrders
+        """
+
+        return await self._get("orders")
+
+    async def get_order_by_id(self, order_id: str) -> dict:
+        """Получение заказа по ID.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/GetOrderByID
+        """
+
+        return await self._get(_URL_ORDER(order_id))
+
+    async def capture_order(self, order_id: str, **data) -> dict:
+        """Полное или частичное списание авторизованного платежа заказа.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/CaptureOrder
+        """
+
+        return await self._post_json(_URL_CAPTURE(order_id), CaptureOrder(**data).dict(exclude_unset=True))
+
+    async def get_order_events(self, order_id: str) -> dict:
+        """Получение истории событий по заказу.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/GetOrderEvents
+        """
+
+        return await self._get(_URL_EVENTS(order_id))
+
+    async def refund_order(self, order_id: str, **data) -> dict:
+        """Создание нового возврата по списанному платежу.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/RefundOrder
+        """
+
+        return await self._post_json(_URL_REFUNDS(order_id), RefundOrder(**data).dict(exclude_unset=True))
+
+    async def get_refunds(self, order_id: str) -> dict:
+        """Выдача возвратов.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/GetRefundByID
+        """
+
+        return await self._get(_URL_REFUNDS(order_id))
+
+    async def get_refund_by_id(self, order_id: str, refund_id: str) -> dict:
+        """Выдача возвратов по идентификатору.
+        https://ioka.kz/docs_v2.html#tag/orders/operation/GetRefundByID
+        """
+
+        return await self._get(_URL_REFUND_BY_ID(order_id, refund_id))
+
+
+class AsyncIoka(AsyncApi):
+    @property
+    def order(self):
+        return AsyncOrder.set_api(self)
@@ -1,7 +1,15 @@
+import asyncio
+import typing
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from api import Event, Order
+import httpx
+import orjson
+import requests
+from requests.adapters import BaseAdapter
+
+import api
+from api import Api, AsyncApi, AsyncIoka, AsyncOrder, Error, Event, ISODatetime, Ioka, Order, Refund
 
 
 class TestOrder(unittest.TestCase):
@@ -78,6 +86,26 @@ class TestOrder(unittest.TestCase):
         self.api_mock.get_orders.assert_called_once_with()
         self.assertEqual(result, expected_orders)
 
+    def test_list_ignores_unknown_fields(self):
+        self.api_mock.get_orders.return_value = [{**self.order_data, "payments": [{"id": "1"}]}]
+        self.api_mock.get_order_by_id.return_value = self.order_data
+        result = Order.list()
+        self.assertFalse(hasattr(result[0], "payments"))
+        self.assertNotIn("payments", result[0].dict())
+        self.assertEqual(result[0], Order.retrieve(order_id="1"))
+
+    def test_list_validate_response(self):
+        orders_data = [self.order_data]
+        self.api_mock.get_orders.return_value = orders_data
+        expected_orders = [Order(**d) for d in orders_data]
+        Order.validate_response = True
+        try:
+            result = Order.list()
+        finally:
+            Order.validate_response = False
+        self.assertEqual(result, expected_orders)
+        self.assertEqual(result[0].created_at, "2022-03-18T12:00:00")
+
     def test_retrieve(self):
         expected_order = Order(**self.order_data)
         self.api_mock.get_order_by_id.return_value = self.order_data
@@ -142,6 +170,243 @@ class TestOrder(unittest.TestCase):
         self.api_mock.get_order_events.assert_called_once_with(order_id="1")
         self.assertEqual(result, expected_events)
 
+    def test_refund_list(self):
+        expected_order = Order(**self.order_data)
+        response_data = [
+            {
+                "id": "string",
+                "payment_id": "string",
+                "order_id": "1",
+                "status": "DECLINED",
+                "created_at": "2019-08-24T14:15:22Z",
+                "error": {"code": "string", "message": "string"},
+                "acquirer": {"name": "string", "reference": "string"},
+            }
+        ]
+        self.api_mock.get_refunds.return_value = response_data
+        result = expected_order.refund_list()
+        self.api_mock.get_refunds.assert_called_once_with(order_id="1")
+        self.assertIsInstance(result[0], Refund)
+        self.assertIsInstance(result[0].error, Error)
+        self.assertEqual(result[0].error.code, "string")
+        self.assertEqual(result[0].created_at, "2019-08-24T14:15:22")
+
+
+class TestAsyncOrder(unittest.TestCase):
+    def setUp(self):
+        self.order_data = {
+            "id": "1",
+            "shop_id": "123",
+            "status": "UNPAID",
+            "created_at": "2022-03-18T12:00:00Z",
+            "amount": 50000,
+            "currency": "KZT",
+            "capture_method": "AUTO",
+        }
+        self.api_mock = MagicMock()
+        self.order = AsyncOrder.set_api(self.api_mock)
+
+    def test_retrieve(self):
+        self.api_mock.get_order_by_id = AsyncMock(return_value=self.order_data)
+        result = asyncio.run(AsyncOrder.retrieve(order_id="1"))
+        self.api_mock.get_order_by_id.assert_awaited_once_with("1")
+        self.assertIsInstance(result, AsyncOrder)
+        self.assertEqual(result, Order(**self.order_data))
+
+    def test_get_events(self):
+        order = AsyncOrder(**self.order_data)
+        response_data = [
+            {
+                "id": "string",
+                "name": "ORDER_CREATED",
+                "created_at": "2022-03-18T12:00:00",
+                "order_id": "1",
+            }
+        ]
+        self.api_mock.get_order_events = AsyncMock(return_value=response_data)
+        result = asyncio.run(order.get_events())
+        self.api_mock.get_order_events.assert_awaited_once_with(order_id="1")
+        self.assertEqual(result, [Event(**e) for e in response_data])
+
+    def test_order_binding_is_separate(self):
+        ioka = Ioka(api_key="key")
+        aioka = AsyncIoka(api_key="key")
+        orders = ioka.order
+        self.assertIsNot(aioka.order, orders)
+        self.assertIs(orders.api, ioka)
+        self.assertIs(aioka.order.api, aioka)
+        asyncio.run(aioka.aclose())
+
+
+class StubAdapter(BaseAdapter):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.path_url.endswith("/missing"):
+            response.status_code = 404
+            response._content = b'{"code":"NotFound"}'
+        else:
+            response.status_code = 200
+            response._content = orjson.dumps({"path": request.path_url})
+
+        return response
+
+    def close(self):
+        pass
+
+
+class TestApi(unittest.TestCase):
+    def setUp(self):
+        self.api = Api(api_key="key", api_host="https://ioka.test")
+        self.adapter = StubAdapter()
+        self.api._session.mount("https://", self.adapter)
+        self.requests = self.adapter.requests
+
+    def tearDown(self):
+        self.api._session.close()
+
+    def test_get(self):
+        result = self.api._get("orders")
+        self.assertEqual(result, {"path": "/v2/orders"})
+        request = self.requests[0]
+        self.assertEqual(request.method, "GET")
+        self.assertEqual(request.headers["API-KEY"], "key")
+
+    def test_post_json(self):
+        result = self.api._post_json("orders/1/capture", {"amount": 200})
+        self.assertEqual(result, {"path": "/v2/orders/1/capture"})
+        request = self.requests[0]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.headers["API-KEY"], "key")
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.body, b'{"amount":200}')
+
+    def test_get_error(self):
+        with self.assertRaises(requests.HTTPError):
+            self.api._get("orders/missing")
+
+    def test_request_without_raise_for_status(self):
+        response = self.api._request("get", "orders/missing", raise_for_status=False)
+        self.assertIsInstance(response, requests.Response)
+        self.assertEqual(response.status_code, 404)
+
+    def test_settings_are_immutable(self):
+        with self.assertRaises(TypeError):
+            self.api.api_key = "other"
+
+    def test_request_headers(self):
+        self.api._request("post", "orders", {"amount": 200}, headers={"X-Test": "1"})
+        request = self.requests[0]
+        self.assertEqual(request.headers["X-Test"], "1")
+        self.assertEqual(request.headers["API-KEY"], "key")
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.body, b'{"amount":200}')
+
+
+class TestAsyncApi(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.api = AsyncApi(api_key="key", api_host="https://ioka.test")
+        asyncio.run(self.api.aclose())
+        self.api._client = httpx.AsyncClient(
+            base_url=self.api._base_url, headers=self.api._headers, transport=httpx.MockTransport(self.handler)
+        )
+
+    def tearDown(self):
+        asyncio.run(self.api.aclose())
+
+    def handler(self, request):
+        self.requests.append(request)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"code": "NotFound"})
+
+        return httpx.Response(200, json={"path": request.url.path})
+
+    def test_get(self):
+        result = asyncio.run(self.api._get("orders"))
+        self.assertEqual(result, {"path": "/v2/orders"})
+        request = self.requests[0]
+        self.assertEqual(request.method, "GET")
+        self.assertEqual(request.headers["API-KEY"], "key")
+
+    def test_post_json(self):
+        result = asyncio.run(self.api._post_json("orders/1/capture", {"amount": 200}))
+        self.assertEqual(result, {"path": "/v2/orders/1/capture"})
+        request = self.requests[0]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.content, b'{"amount":200}')
+
+    def test_post_json_non_str_keys(self):
+        asyncio.run(self.api.create_order(amount=100, extra_info={1: "a"}))
+        self.assertEqual(self.requests[0].content, b'{"amount":100,"extra_info":{"1":"a"}}')
+
+    def test_get_error(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(self.api._get("orders/missing"))
+
+
+class TestISODatetime(unittest.TestCase):
+    def test_validate(self):
+        cases = {
+            "2019-08-24T14:15:22": "2019-08-24T14:15:22",
+            "2019-08-24T14:15:22Z": "2019-08-24T14:15:22",
+            "2019-08-24T14:15:22.123456Z": "2019-08-24T14:15:22.123456",
+            "2019-08-24T14:15:22.000000": "2019-08-24T14:15:22",
+            "2019-08-24T14:15:22.123Z": "2019-08-24T14:15:22.123000",
+            "2019-08-24T14:15:22+00:00": "2019-08-24T14:15:22",
+        }
+        for value, expected in cases.items():
+            self.assertEqual(ISODatetime.validate(value), expected)
+
+        invalid = (
+            "2019-08-24T14-15-22",
+            "2019-13-45T99:99:99",
+            "abcd-ef-ghTij:kl:mn",
+            "2019-02-29T00:00:00",
+            "2019-08-24T14:15:22.²²²²²²",
+            "٢٠١٩-08-24T14:15:22",
+        )
+        for value in invalid:
+            with self.assertRaises(ValueError):
+                ISODatetime.validate(value)
+
+
+class TestWarmModels(unittest.TestCase):
+    def setUp(self):
+        api._models_warmed = False
+
+    def tearDown(self):
+        api._models_warmed = False
+
+    def test_warm_models_once(self):
+        with patch.dict("os.environ", {"IOKA_WARM_MODELS": "1"}):
+            with patch.object(api, "CreateOrder", wraps=api.CreateOrder) as create_order:
+                Ioka(api_key="key")
+                Ioka(api_key="key")
+        self.assertEqual(create_order.call_count, 1)
+        self.assertTrue(api._models_warmed)
+
+    def test_warm_models_disabled(self):
+        with patch.dict("os.environ", {}, clear=True):
+            with patch.object(api, "CreateOrder", wraps=api.CreateOrder) as create_order:
+                Ioka(api_key="key")
+        create_order.assert_not_called()
+        self.assertFalse(api._models_warmed)
+
+
+class TestLiterals(unittest.TestCase):
+    def test_literals_match_enums(self):
+        for name in ("CaptureMethod", "OrderStatus", "Currency", "PaymentStatus", "PayerType", "EventName", "RefundStatus"):
+            enum = getattr(api, f"{name}Enum")
+            self.assertEqual(set(typing.get_args(getattr(api, name))), {m.value for m in enum}, name)
+
 
 if __name__ == "__main__":
     unittest.main()